@@ -2,6 +2,7 @@ import asyncio
 from logging.config import fileConfig
 
 from sqlmodel import SQLModel
+from sqlmodel.sql.sqltypes import AutoString
 
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
@@ -36,12 +37,9 @@ def render_item(type_: str, obj, autogen_context):
     This avoids the 'sqlmodel not defined' error in generated migrations by
     converting sqlmodel.sql.sqltypes.AutoString to sa.String().
     """
-    if type_ == "type":
-        from sqlmodel.sql.sqltypes import AutoString
-
-        if isinstance(obj, AutoString):
-            # Return standard SQLAlchemy String instead of SQLModel's AutoString
-            return "sa.String()"
+    if type_ == "type" and isinstance(obj, AutoString):
+        # Return standard SQLAlchemy String instead of SQLModel's AutoString
+        return "sa.String()"
     # Return False to use default rendering for other types
     return False
 
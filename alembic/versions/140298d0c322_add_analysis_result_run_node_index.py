@@ -0,0 +1,28 @@
+"""add_analysis_result_run_node_index
+
+Revision ID: 140298d0c322
+Revises: 6170a378e141
+Create Date: 2026-10-15 22:58:41.907215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '140298d0c322'
+down_revision: Union[str, Sequence[str], None] = '6170a378e141'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_analysis_result_run_node', 'analysis_result', ['run_id', 'node_name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_analysis_result_run_node', table_name='analysis_result')
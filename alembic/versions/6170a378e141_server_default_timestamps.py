@@ -0,0 +1,42 @@
+"""server_default_timestamps
+
+Revision ID: 6170a378e141
+Revises: 98d381fc7074
+Create Date: 2026-10-15 22:45:10.312584
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6170a378e141'
+down_revision: Union[str, Sequence[str], None] = '98d381fc7074'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('analysis_result', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               server_default=sa.text('now()'))
+    op.alter_column('evaluation_run', 'start_ts',
+               existing_type=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('evaluation_run', 'start_ts',
+               existing_type=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               server_default=None)
+    op.alter_column('analysis_result', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               server_default=None)
@@ -1,8 +1,8 @@
 """GitHub webhook endpoint: signature verification, payload parsing, and event routing."""
 
-import json
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends, Header, HTTPException, Request
 
 from app.core.config import settings
@@ -42,8 +42,8 @@ async def handle_github_webhook(
 
     # 2. Parse payload
     try:
-        payload = json.loads(raw_body)
-    except json.JSONDecodeError:
+        payload = orjson.loads(raw_body)
+    except orjson.JSONDecodeError:
         return {"error": "Invalid JSON body"}
 
     # 3. Route by event type
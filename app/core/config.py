@@ -44,6 +44,15 @@ class Settings(BaseSettings):
     JIRA_EMAIL: str
     JIRA_API_TOKEN: str
 
+    # Change management
+    # Skip the LLM audit for PRs touching only docs, tests or stylesheets.
+    # Skipped PRs are recorded as UNKNOWN (needs human review), not approved.
+    LLM_SKIP_TRIVIAL_CHANGES: bool = False
+    # Diffs longer than this are trimmed before the LLM audit, and a trimmed
+    # audit is capped at UNKNOWN.  ~250k tokens: sized to gpt-5-mini's 400k
+    # context with room for the prompt and response.
+    LLM_DIFF_MAX_CHARS: int = 1_000_000
+
     @field_validator("GITHUB_APP_PRIVATE_KEY", mode="after")
     @classmethod
     def load_private_key(cls, v: str) -> str:
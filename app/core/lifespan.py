@@ -3,9 +3,25 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import httpx
 
+from app.core.logging import get_logger
 from app.db.session import engine
 from app.services.change_management.cache_updater import cache_updater_task
 
+logger = get_logger(__name__)
+
+
+def _log_task_crash(task: asyncio.Task) -> None:
+    """Done-callback: surface a background task's crash immediately."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error(
+            "Background task %s crashed and will not restart",
+            task.get_name(),
+            exc_info=exc,
+        )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -25,19 +41,41 @@ async def lifespan(app: FastAPI):
     )
 
     # 2. Start cache updater background task
-    cache_task = asyncio.create_task(cache_updater_task())
+    cache_task = asyncio.create_task(cache_updater_task(), name="cache_updater")
+    cache_task.add_done_callback(_log_task_crash)
 
     yield
 
-    # 3. Stop cache updater
-    cache_task.cancel()
-    try:
-        await cache_task
-    except asyncio.CancelledError:
-        pass
+    async def _shutdown() -> None:
+        # 3. Stop cache updater
+        cache_task.cancel()
+        try:
+            await cache_task
+        except asyncio.CancelledError:
+            pass
 
-    # 4. Close shared HTTP client
-    await app.state.http_client.aclose()
+        # 4. Close shared HTTP client and dispose Database Engine.
+        # Independent of each other, so release them concurrently and make
+        # sure one failing doesn't stop the other.
+        results = await asyncio.gather(
+            app.state.http_client.aclose(),
+            engine.dispose(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error during shutdown: %s", result, exc_info=result)
 
-    # 5. Dispose Database Engine
-    await engine.dispose()
+    # Run cleanup as its own task and keep re-shielding it until it is
+    # done: cancelling the lifespan, even repeatedly (e.g. Ctrl+C twice),
+    # never interrupts closing the HTTP client and DB pool.  The
+    # cancellation is re-raised once cleanup has finished.
+    shutdown_task = asyncio.ensure_future(_shutdown())
+    cancelled = False
+    while not shutdown_task.done():
+        try:
+            await asyncio.shield(shutdown_task)
+        except asyncio.CancelledError:
+            cancelled = True
+    if cancelled:
+        raise asyncio.CancelledError
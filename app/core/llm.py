@@ -18,4 +18,5 @@ default_llm = ChatOpenAI(
     temperature=0,
     max_completion_tokens=1000,
     max_retries=3,
+    timeout=30,
 )
@@ -8,33 +8,61 @@ Usage:
     logger.info("Hello world")
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log writer, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(level: str = "INFO") -> None:
     """
     Configure the root logger with a standard format.
 
+    Records are handed to a QueueHandler, and a QueueListener thread does
+    the formatting and stdout writes, so logging from async code never
+    blocks the event loop on I/O.
+
     Should be called once at application startup (e.g., in main.py or lifespan).
 
     Args:
         level: Log level string (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
+    global _queue_listener
+
     log_format = "%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-        ],
-        force=True,  # Override any existing configuration
-    )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+
+    # Override any existing configuration (including a previous listener)
+    _stop_queue_listener()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+
+    _queue_listener = QueueListener(log_queue, stream_handler)
+    _queue_listener.start()
 
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -10,9 +10,9 @@ All analysis result types in one place:
 
 import uuid
 from typing import Dict, Any, Optional, TYPE_CHECKING
-from datetime import datetime, timezone
+from datetime import datetime
 from sqlmodel import SQLModel, Relationship, Field
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 
 if TYPE_CHECKING:
@@ -64,6 +64,10 @@ class AnalysisResult(AnalysisResultBase, table=True):
     """
 
     __tablename__ = "analysis_result"
+    # selectinload(EvaluationRun.analysis_results) looks rows up by run_id
+    __table_args__ = (
+        Index("ix_analysis_result_run_node", "run_id", "node_name"),
+    )
 
     # Override details to use JSONB column type
     details: dict = Field(
@@ -83,10 +87,15 @@ class AnalysisResult(AnalysisResultBase, table=True):
         foreign_key="evaluation_run.id",
         description="The ID of the evaluation run.",
     )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        sa_column=Column(DateTime(timezone=True), nullable=False),
-        description="The time when the analysis result was updated.",
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+            onupdate=func.now(),
+        ),
+        description="The time when the analysis result was updated (set by the DB).",
     )
 
     evaluation_run: Optional["EvaluationRun"] = Relationship(
@@ -94,8 +103,8 @@ class AnalysisResult(AnalysisResultBase, table=True):
     )
 
     def to_public(self) -> "AnalysisResultPublic":
-        """Convert to render-safe public DTO."""
-        return AnalysisResultPublic(
+        """Convert to render-safe public DTO (ORM values, validation skipped)."""
+        return AnalysisResultPublic.model_construct(
             id=self.id,
             node_name=self.node_name,
             reason_code=self.reason_code,
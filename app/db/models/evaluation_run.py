@@ -6,10 +6,10 @@ Key: evaluation_key (unique)
 """
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, String, func, inspect
 from enum import Enum
 
 from app.db.models.analysis_result import AnalysisResultPublic
@@ -85,9 +85,11 @@ class EvaluationRun(EvaluationRunBase, table=True):
         index=True,
         nullable=False,
     )
-    start_ts: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        sa_column=Column(DateTime(timezone=True), nullable=False),
+    start_ts: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default=func.now()
+        ),
     )
     end_ts: Optional[datetime] = Field(
         default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
@@ -98,9 +100,26 @@ class EvaluationRun(EvaluationRunBase, table=True):
         back_populates="evaluation_run"
     )
 
-    def to_public(self) -> "EvaluationRunPublic":
-        """Convert to render-safe public DTO."""
-        return EvaluationRunPublic(
+    def to_public(self, include_results: bool = True) -> "EvaluationRunPublic":
+        """
+        Convert to render-safe public DTO.
+
+        Pass include_results=False for list views; analysis_results is then
+        left empty and the relationship is never touched.  With
+        include_results=True the results must already be loaded (selectinload
+        at the query): a lazy load would fail under AsyncSession, so an
+        unloaded relationship raises instead of silently reading as empty.
+        Values come straight from the ORM, so validation is skipped.
+        """
+        results: List["AnalysisResult"] = []
+        if include_results:
+            if "analysis_results" in inspect(self).unloaded:
+                raise RuntimeError(
+                    f"EvaluationRun {self.id}: analysis_results is not loaded; "
+                    "eager-load it or call to_public(include_results=False)"
+                )
+            results = self.analysis_results
+        return EvaluationRunPublic.model_construct(
             id=self.id,
             evaluation_key=self.evaluation_key,
             status=self.status,
@@ -110,7 +129,7 @@ class EvaluationRun(EvaluationRunBase, table=True):
             pr_number=self.pr_number,
             start_ts=self.start_ts,
             end_ts=self.end_ts,
-            analysis_results=[ar.to_public() for ar in (self.analysis_results or [])],
+            analysis_results=[ar.to_public() for ar in results],
         )
 
 
@@ -9,16 +9,37 @@ Attributes:
     engine: The global SQLModel engine instance used for database operations.
 """
 
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings
 
+
+def _json_serializer(obj) -> str:
+    """Serialize JSON/JSONB bind values with orjson."""
+    # OPT_NON_STR_KEYS keeps stdlib json's behaviour of stringifying keys
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 engine_kwargs = {
+    # Pinned so a URL/driver change can never silently fall back to NullPool
+    # (a fresh connection + TLS handshake per session).
+    "poolclass": AsyncAdaptedQueuePool,
     "pool_size": 10,
     "max_overflow": 20,
     "pool_timeout": 30,
     "pool_recycle": 1800,
     "pool_pre_ping": True,
+    # Reuse the most recently returned connection so idle extras can be
+    # recycled instead of every connection being kept lukewarm.
+    "pool_use_lifo": True,
+    # JSONB columns (e.g. analysis_result.details) go through orjson
+    "json_serializer": _json_serializer,
+    "json_deserializer": orjson.loads,
+    # Our queries are small OLTP lookups; JIT compilation only adds
+    # planning latency to them.
+    "connect_args": {"server_settings": {"jit": "off"}},
 }
 
 database_url = settings.DATABASE_URL
@@ -2,10 +2,11 @@
 GitHub integration package.
 """
 
-from app.integrations.github.auth import get_access_token
+from app.integrations.github.auth import get_access_token, invalidate_access_token
 from app.integrations.github.client import GitHubClient
 
 __all__ = [
     "get_access_token",
+    "invalidate_access_token",
     "GitHubClient",
 ]
@@ -2,31 +2,111 @@
 GitHub App authentication utilities.
 """
 
+import asyncio
 import time
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import DefaultDict, Dict, Optional, Tuple
 
 import jwt
 import httpx
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
 from app.core.config import settings
 
+# Installation tokens live for an hour; refresh this long before expiry so a
+# token never runs out mid-workflow.
+_TOKEN_REFRESH_MARGIN = 5 * 60  # seconds
+
+# installation_id -> (token, unix time after which it must be refreshed)
+_token_cache: Dict[int, Tuple[str, float]] = {}
+
+# One lock per installation so concurrent webhooks share a single refresh
+_token_locks: DefaultDict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# The App JWT is the same for every installation and valid for 10 minutes;
+# reuse it until a minute before it expires instead of re-signing (RS256).
+_JWT_LIFETIME = 10 * 60  # seconds
+_JWT_REFRESH_MARGIN = 60  # seconds
+
+# (jwt, unix expiry)
+_jwt_cache: Optional[Tuple[str, int]] = None
+
+
+@lru_cache(maxsize=1)
+def _load_private_key() -> PrivateKeyTypes:
+    """Parse the App's PEM private key once, on first use."""
+    return load_pem_private_key(settings.GITHUB_APP_PRIVATE_KEY.encode(), password=None)
+
+
+def _get_app_jwt() -> str:
+    """Return the App JWT (the "ID Badge" for the App), re-signed near expiry."""
+    global _jwt_cache
+    now = int(time.time())
+    if _jwt_cache and now < _jwt_cache[1] - _JWT_REFRESH_MARGIN:
+        return _jwt_cache[0]
 
-async def get_access_token(client: httpx.AsyncClient, installation_id: int) -> str:
-    """Exchanges Private Key + Installation ID for a temporary Token"""
-    # Create the JWT (The "ID Badge" for the App)
     payload = {
-        "iat": int(time.time()) - 60,
-        "exp": int(time.time()) + (10 * 60),
+        "iat": now - 60,
+        "exp": now + _JWT_LIFETIME,
         "iss": settings.GITHUB_APP_ID,
     }
-    jwt_token = jwt.encode(payload, settings.GITHUB_APP_PRIVATE_KEY, algorithm="RS256")
-
-    # Request the Token from GitHub
-    resp = await client.post(
-        f"https://api.github.com/app/installations/{installation_id}/access_tokens",
-        headers={
-            "Authorization": f"Bearer {jwt_token}",
-            "Accept": "application/vnd.github+json",
-        },
-    )
-    resp.raise_for_status()
-    return resp.json()["token"]
+    jwt_token = jwt.encode(payload, _load_private_key(), algorithm="RS256")
+    _jwt_cache = (jwt_token, payload["exp"])
+    return jwt_token
+
+
+def _cached_token(installation_id: int) -> Optional[str]:
+    """Return the cached installation token if it is still fresh."""
+    cached = _token_cache.get(installation_id)
+    if cached and time.time() < cached[1]:
+        return cached[0]
+    return None
+
+
+def invalidate_access_token(installation_id: int, token: Optional[str] = None) -> None:
+    """Drop a cached installation token that GitHub has rejected (e.g. revoked).
+
+    If *token* is given, only that token is dropped, so a caller holding a
+    stale token cannot evict a fresh one another caller already fetched.
+    """
+    cached = _token_cache.get(installation_id)
+    if cached and (token is None or cached[0] == token):
+        del _token_cache[installation_id]
+
+
+async def get_access_token(client: httpx.AsyncClient, installation_id: int) -> str:
+    """Exchanges Private Key + Installation ID for a temporary Token"""
+    token = _cached_token(installation_id)
+    if token:
+        return token
+
+    async with _token_locks[installation_id]:
+        # Another caller may have refreshed it while we waited for the lock
+        token = _cached_token(installation_id)
+        if token:
+            return token
+
+        jwt_token = _get_app_jwt()
+
+        # Request the Token from GitHub
+        resp = await client.post(
+            f"https://api.github.com/app/installations/{installation_id}/access_tokens",
+            headers={
+                "Authorization": f"Bearer {jwt_token}",
+                "Accept": "application/vnd.github+json",
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        token = data["token"]
+
+        # Only cache when GitHub tells us when the token expires
+        expires_at = data.get("expires_at")
+        if expires_at:
+            expiry = datetime.fromisoformat(expires_at).timestamp()
+            _token_cache[installation_id] = (token, expiry - _TOKEN_REFRESH_MARGIN)
+
+        return token
@@ -13,28 +13,71 @@ import hashlib
 from typing import Dict, List, Optional, Any
 import httpx
 
+from app.integrations.github.auth import get_access_token, invalidate_access_token
+
 
 class GitHubClient:
     """Client for interacting with GitHub REST API."""
 
-    def __init__(self, client: httpx.AsyncClient, token: Optional[str] = None):
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        token: Optional[str] = None,
+        installation_id: Optional[int] = None,
+    ):
         """
         Initialize GitHub client.
 
         Args:
             client: Shared HTTP client.
             token: GitHub Personal Access Token or GitHub App token
+            installation_id: GitHub App installation the token belongs to.
+                When set, a 401 (e.g. a revoked token) drops the cached
+                token and the request is retried once with a fresh one.
         """
         self.client = client
-        self.token = token
+        self.installation_id = installation_id
         self.base_url = "https://api.github.com"
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "ITSM-Agent/1.0",
         }
+        self._set_token(token)
+
+    def _set_token(self, token: Optional[str]) -> None:
+        self.token = token
         if token:
             self.headers["Authorization"] = f"token {token}"
 
+    async def _refresh_token(self, rejected: Optional[str]) -> bool:
+        """Replace a token GitHub rejected; False if it isn't an App token."""
+        if self.installation_id is None:
+            return False
+        # A concurrent request may already have swapped in a fresh token
+        if self.token == rejected:
+            invalidate_access_token(self.installation_id, rejected)
+            self._set_token(await get_access_token(self.client, self.installation_id))
+        return True
+
+    async def _get(self, url: str, accept: Optional[str] = None) -> httpx.Response:
+        """GET *url*, retrying once with a fresh installation token on 401."""
+        token = self.token
+        response = await self.client.get(url, headers=self._headers(accept))
+        if response.status_code == 401 and await self._refresh_token(token):
+            response = await self.client.get(url, headers=self._headers(accept))
+        return response
+
+    async def _post(self, url: str, json: Any) -> httpx.Response:
+        """POST *json* to *url*, retrying once with a fresh token on 401."""
+        token = self.token
+        response = await self.client.post(url, headers=self.headers, json=json)
+        if response.status_code == 401 and await self._refresh_token(token):
+            response = await self.client.post(url, headers=self.headers, json=json)
+        return response
+
+    def _headers(self, accept: Optional[str]) -> Dict[str, str]:
+        return {**self.headers, "Accept": accept} if accept else self.headers
+
     async def get_pr(self, owner: str, repo: str, pr_number: int) -> Dict[str, Any]:
         """
         Get pull request details.
@@ -49,7 +92,7 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}"
 
-        response = await self.client.get(url, headers=self.headers)
+        response = await self._get(url)
         response.raise_for_status()
         return response.json()
 
@@ -69,7 +112,7 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/files"
 
-        response = await self.client.get(url, headers=self.headers)
+        response = await self._get(url)
         response.raise_for_status()
         return response.json()
 
@@ -87,12 +130,8 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}"
 
-        headers = {
-            **self.headers,
-            "Accept": "application/vnd.github.v3.diff",  # Request diff format
-        }
-
-        response = await self.client.get(url, headers=headers)
+        # Request diff format
+        response = await self._get(url, accept="application/vnd.github.v3.diff")
         response.raise_for_status()
         return response.text
 
@@ -125,8 +164,8 @@ class GitHubClient:
 
         # Fetch both in parallel
         pr_response, files_response = await asyncio.gather(
-            self.client.get(pr_url, headers=self.headers),
-            self.client.get(files_url, headers=self.headers),
+            self._get(pr_url),
+            self._get(files_url),
         )
 
         pr_response.raise_for_status()
@@ -178,7 +217,5 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{owner}/{repo}/issues/{pr_number}/comments"
 
-        response = await self.client.post(
-            url, headers=self.headers, json={"body": comment}
-        )
+        response = await self._post(url, json={"body": comment})
         response.raise_for_status()
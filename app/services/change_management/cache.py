@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from datetime import datetime
 import asyncio
 
+from sse_starlette.event import ServerSentEvent
+
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -18,36 +20,54 @@ class CachedEvaluations:
     """Cached evaluation data with version tracking."""
 
     html: str
+    frame: bytes
     updated_at: datetime
     version: int
 
 
+def _encode_frame(html: str) -> bytes:
+    """Encode *html* as a complete ``eval-update`` SSE frame."""
+    return ServerSentEvent(data=html, event="eval-update").encode()
+
+
 class EvaluationCache:
     """Thread-safe in-memory cache for evaluation HTML."""
 
     def __init__(self):
         self._data: Optional[CachedEvaluations] = None
-        self._lock = asyncio.Lock()
         self._version = 0
+        # Guards version bumps and wakes waiting readers; plain reads of
+        # _data/_version need no lock (single attribute loads).
         self._condition = asyncio.Condition()
 
     async def get(self) -> Optional[CachedEvaluations]:
         """Get cached data (no lock needed for read)."""
         return self._data
 
-    async def update(self, html: str):
-        """Update cache with new data and notify all waiting SSE clients."""
-        async with self._lock:
+    async def update(self, html: str) -> bool:
+        """
+        Update cache with new data and notify all waiting SSE clients.
+
+        Returns False (and wakes nobody) if *html* matches the cached copy.
+        """
+        current = self._data
+        if current is not None and current.html == html:
+            logger.debug("Cache unchanged at version %d", current.version)
+            return False
+
+        frame = _encode_frame(html)
+        async with self._condition:
             self._version += 1
             self._data = CachedEvaluations(
                 html=html,
+                frame=frame,
                 updated_at=datetime.now(),
                 version=self._version,
             )
             logger.debug("Cache updated to version %d", self._version)
-        # Wake all SSE clients waiting for a new version
-        async with self._condition:
+            # Wake all SSE clients waiting for a new version
             self._condition.notify_all()
+        return True
 
     async def wait_for_update(self, current_version: int, timeout: float) -> bool:
         """
@@ -73,10 +93,14 @@ class EvaluationCache:
         return self._data is None
 
 
-# Global singleton
-_cache = EvaluationCache()
+# Global singleton, created on first use (like the notifier's event) so
+# importing this module never builds asyncio primitives up front.
+_cache: Optional[EvaluationCache] = None
 
 
 def get_evaluation_cache() -> EvaluationCache:
     """Get the global evaluation cache instance."""
+    global _cache
+    if _cache is None:
+        _cache = EvaluationCache()
     return _cache
@@ -8,35 +8,52 @@ executed per notification, and all SSE clients share the result.
 """
 
 import asyncio
+import random
 import time
 
 from fastapi.templating import Jinja2Templates
 
 from app.services.change_management.cache import get_evaluation_cache
 from app.core.logging import get_logger
-from app.services.change_management.notifier import wait_for_notification
+from app.services.change_management.notifier import (
+    drain_notifications,
+    wait_for_notification,
+)
 from app.db.session import AsyncSessionLocal
 from app.services.change_management.evaluations import EvaluationService
 
 logger = get_logger(__name__)
 templates = Jinja2Templates(directory="app/templates")
 
+# Resolved once at import; the updater renders it on every refresh.
+_LATEST_TEMPLATE = templates.get_template("partials/evaluations_latest.html")
+
 # Safety-net: even without a notification, refresh from DB at most every
 # 5 minutes so the cache self-heals after missed events or deploys.
 _FALLBACK_REFRESH_INTERVAL = 300  # seconds
 
+# After a notification, wait this long before querying so a burst of
+# writes (e.g. one per analysis node) collapses into a single refresh.
+_COALESCE_WINDOW = 0.05  # seconds
+
+# A failed refresh is retried after this backoff instead of leaving the
+# cache stale until the next notification: doubles per consecutive failure
+# up to the cap, with jitter, and resets on the next successful refresh.
+_ERROR_BACKOFF_INITIAL = 0.5  # seconds
+_ERROR_BACKOFF_MAX = 30.0  # seconds
 
 async def _fetch_and_render(limit: int = 5) -> str:
     """Fetch latest evaluations (per PR) from DB and render to HTML."""
     async with AsyncSessionLocal() as session:
         service = EvaluationService(session)
-        evals = await service.get_latest_per_pr(limit=limit)
+        evals = await service.get_latest_per_pr(limit=limit, include_results=False)
 
-    return (
-        templates.get_template("partials/evaluations_latest.html")
-        .render({"request": None, "evaluations": evals})
-        .replace("\n", "")
+    # Rendering is pure CPU work; keep it off the event loop so SSE
+    # clients and webhook handlers aren't stalled while it runs.
+    html = await asyncio.to_thread(
+        _LATEST_TEMPLATE.render, {"request": None, "evaluations": evals}
     )
+    return html.replace("\n", "")
 
 
 async def cache_updater_task():
@@ -47,51 +64,73 @@ async def cache_updater_task():
        as a self-healing fallback)
     3. Renders HTML template (once per update)
     4. Updates in-memory cache (all SSE clients read from here)
+    5. Retries a failed refresh with jittered exponential backoff
     """
     cache = get_evaluation_cache()
     logger.info("Cache updater task started")
 
     # Initial population
+    refresh_failed = False
     try:
         html = await _fetch_and_render()
         await cache.update(html)
         logger.info("Cache initialized with initial data")
     except Exception as e:
         logger.error("Failed to initialize cache: %s", e)
+        refresh_failed = True
 
     last_refresh = time.monotonic()
+    backoff = _ERROR_BACKOFF_INITIAL
 
     # Event-driven loop
     while True:
         try:
-            notified = await wait_for_notification(timeout=30.0)
-            elapsed = time.monotonic() - last_refresh
-
-            if not notified and elapsed < _FALLBACK_REFRESH_INTERVAL:
-                logger.debug("Cache updater heartbeat (no DB query)")
-                continue
-
-            if notified:
-                logger.debug("Cache updater received notification")
+            if refresh_failed:
+                delay = backoff * (0.5 + random.random())
+                logger.debug("Retrying failed cache refresh in %.1fs", delay)
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, _ERROR_BACKOFF_MAX)
+                # Anything notified meanwhile is covered by this retry
+                drain_notifications()
             else:
-                logger.debug(
-                    "Cache updater periodic fallback refresh (%.0fs since last)",
-                    elapsed,
-                )
+                notified = await wait_for_notification(timeout=30.0)
+                elapsed = time.monotonic() - last_refresh
+
+                if not notified and elapsed < _FALLBACK_REFRESH_INTERVAL:
+                    logger.debug("Cache updater heartbeat (no DB query)")
+                    continue
+
+                if notified:
+                    logger.debug("Cache updater received notification")
+                    await asyncio.sleep(_COALESCE_WINDOW)
+                    if drain_notifications():
+                        logger.debug("Coalesced burst of notifications")
+                else:
+                    logger.debug(
+                        "Cache updater periodic fallback refresh (%.0fs since last)",
+                        elapsed,
+                    )
 
             # Fetch fresh data from DB (ONE query for ALL clients)
             try:
                 async with asyncio.timeout(5.0):
                     html = await _fetch_and_render()
 
-                await cache.update(html)
+                changed = await cache.update(html)
                 last_refresh = time.monotonic()
-                logger.info("Cache updated successfully")
+                refresh_failed = False
+                backoff = _ERROR_BACKOFF_INITIAL
+                if changed:
+                    logger.info("Cache updated successfully")
+                else:
+                    logger.debug("Cache refresh produced no changes")
 
             except asyncio.TimeoutError:
                 logger.error("DB query timeout in cache updater")
+                refresh_failed = True
             except Exception as e:
                 logger.error("Error updating cache: %s", e, exc_info=True)
+                refresh_failed = True
 
         except asyncio.CancelledError:
             logger.info("Cache updater task cancelled")
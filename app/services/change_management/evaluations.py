@@ -2,8 +2,8 @@ from typing import List, Optional
 from datetime import datetime, timezone
 import httpx
 from sqlmodel import select, func
-from sqlalchemy import desc
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, desc, literal_column
+from sqlalchemy.orm import raiseload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert
 
@@ -16,6 +16,63 @@ from app.services.change_management.graph import change_management_graph
 logger = get_logger(__name__)
 
 
+def _latest_per_pr_subquery():
+    """Subquery: latest start_ts per (owner, repo, pr_number)."""
+    return (
+        select(
+            EvaluationRun.owner,
+            EvaluationRun.repo,
+            EvaluationRun.pr_number,
+            func.max(EvaluationRun.start_ts).label("latest_ts"),
+        )
+        .where(EvaluationRun.owner.isnot(None))  # type: ignore
+        .group_by(EvaluationRun.owner, EvaluationRun.repo, EvaluationRun.pr_number)
+        .subquery()
+    )
+
+
+# -----------------------------------------------------------------------------
+# Prebuilt read statements
+# Built once at import with bound skip/limit so the hot read paths (cache
+# updater, dashboard) don't rebuild the statement tree on every call.
+# -----------------------------------------------------------------------------
+_EVALUATIONS_BASE = (
+    select(EvaluationRun)
+    .order_by(desc(EvaluationRun.start_ts))  # type: ignore
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_EVALUATIONS_STMT = _EVALUATIONS_BASE.options(
+    selectinload(EvaluationRun.analysis_results)  # type: ignore
+)
+_EVALUATIONS_SUMMARY_STMT = _EVALUATIONS_BASE.options(
+    raiseload(EvaluationRun.analysis_results)  # type: ignore
+)
+
+_latest_sub = _latest_per_pr_subquery()
+_LATEST_PER_PR_BASE = (
+    select(EvaluationRun)
+    .join(
+        _latest_sub,
+        (EvaluationRun.owner == _latest_sub.c.owner)
+        & (EvaluationRun.repo == _latest_sub.c.repo)
+        & (EvaluationRun.pr_number == _latest_sub.c.pr_number)
+        & (EvaluationRun.start_ts == _latest_sub.c.latest_ts),
+    )
+    .order_by(desc(EvaluationRun.start_ts))  # type: ignore
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_LATEST_PER_PR_STMT = _LATEST_PER_PR_BASE.options(
+    selectinload(EvaluationRun.analysis_results)  # type: ignore
+)
+# Summary views (dashboard table, SSE fragment) never show the results, so
+# skip the second SELECT; raiseload makes any accidental access fail loudly.
+_LATEST_PER_PR_SUMMARY_STMT = _LATEST_PER_PR_BASE.options(
+    raiseload(EvaluationRun.analysis_results)  # type: ignore
+)
+
+
 class EvaluationService:
     def __init__(
         self, session: AsyncSession, http_client: Optional[httpx.AsyncClient] = None
@@ -24,58 +81,29 @@ class EvaluationService:
         self.http_client = http_client
 
     async def get_evaluations(
-        self, skip: int = 0, limit: int = 10
+        self, skip: int = 0, limit: int = 10, include_results: bool = True
     ) -> List[EvaluationRun]:
         """
         Fetch evaluation runs with pagination (all runs).
+
+        With include_results=False, analysis_results are not loaded (and
+        must not be accessed) - for views that only list the runs.
         """
-        statement = (
-            select(EvaluationRun)
-            .options(selectinload(EvaluationRun.analysis_results))  # type: ignore
-            .order_by(desc(EvaluationRun.start_ts))  # type: ignore
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(statement)
+        stmt = _EVALUATIONS_STMT if include_results else _EVALUATIONS_SUMMARY_STMT
+        result = await self.session.execute(stmt, {"skip": skip, "limit": limit})
         return result.scalars().all()  # type: ignore
 
-    def _latest_per_pr_subquery(self):
-        """Subquery: latest start_ts per (owner, repo, pr_number)."""
-        return (
-            select(
-                EvaluationRun.owner,
-                EvaluationRun.repo,
-                EvaluationRun.pr_number,
-                func.max(EvaluationRun.start_ts).label("latest_ts"),
-            )
-            .where(EvaluationRun.owner.isnot(None))  # type: ignore
-            .group_by(EvaluationRun.owner, EvaluationRun.repo, EvaluationRun.pr_number)
-            .subquery()
-        )
-
     async def get_latest_per_pr(
-        self, skip: int = 0, limit: int = 10
+        self, skip: int = 0, limit: int = 10, include_results: bool = True
     ) -> List[EvaluationRun]:
         """
         Fetch the latest evaluation run per PR with pagination.
+
+        With include_results=False, analysis_results are not loaded (and
+        must not be accessed) - for views that only list the runs.
         """
-        latest_sub = self._latest_per_pr_subquery()
-
-        statement = (
-            select(EvaluationRun)
-            .join(
-                latest_sub,
-                (EvaluationRun.owner == latest_sub.c.owner)
-                & (EvaluationRun.repo == latest_sub.c.repo)
-                & (EvaluationRun.pr_number == latest_sub.c.pr_number)
-                & (EvaluationRun.start_ts == latest_sub.c.latest_ts),
-            )
-            .options(selectinload(EvaluationRun.analysis_results))  # type: ignore
-            .order_by(desc(EvaluationRun.start_ts))  # type: ignore
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(statement)
+        stmt = _LATEST_PER_PR_STMT if include_results else _LATEST_PER_PR_SUMMARY_STMT
+        result = await self.session.execute(stmt, {"skip": skip, "limit": limit})
         return result.scalars().all()  # type: ignore
 
     async def count_latest_per_pr(self) -> int:
@@ -200,40 +228,36 @@ class EvaluationService:
         """
         Create an EvaluationRun record with status=PROCESSING.
 
-        Uses ON CONFLICT DO NOTHING for idempotency.
+        Idempotent in one round trip: on a duplicate evaluation_key the
+        no-op ON CONFLICT DO UPDATE still returns the existing row's id.
 
         Returns:
             The run ID (UUID as string)
         """
         evaluation_key = context["evaluation_key"]
-        stmt = (
-            insert(EvaluationRun)
-            .values(
-                evaluation_key=evaluation_key,
-                owner=context["owner"],
-                repo=context["repo"],
-                pr_number=context["pr_number"],
-                status=EvaluationStatus.PROCESSING,
-                start_ts=datetime.now(timezone.utc),
-            )
-            .on_conflict_do_nothing(index_elements=[EvaluationRun.evaluation_key])
-            .returning(EvaluationRun.id)  # type: ignore[call-overload]
+        stmt = insert(EvaluationRun).values(
+            evaluation_key=evaluation_key,
+            owner=context["owner"],
+            repo=context["repo"],
+            pr_number=context["pr_number"],
+            status=EvaluationStatus.PROCESSING,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EvaluationRun.evaluation_key],
+            set_={"evaluation_key": stmt.excluded.evaluation_key},
+        ).returning(
+            EvaluationRun.id,  # type: ignore[arg-type]
+            # xmax is 0 only for a freshly inserted row version
+            literal_column("xmax = 0").label("inserted"),
         )
 
         res = await self.session.execute(stmt)
-        run_id = res.scalar_one_or_none()
+        run_id, inserted = res.one()
 
-        if run_id is None:
-            # Row already exists, fetch existing ID
-            existing = await self.session.execute(
-                select(EvaluationRun.id).where(
-                    EvaluationRun.evaluation_key == evaluation_key
-                )
-            )
-            run_id = existing.scalar_one()
-            logger.info("Evaluation run already exists: %s", evaluation_key)
-        else:
+        if inserted:
             logger.info("Created evaluation run: %s (%s)", run_id, evaluation_key)
+        else:
+            logger.info("Evaluation run already exists: %s", evaluation_key)
 
         await self.session.commit()
         notify_cache_update()
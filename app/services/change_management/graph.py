@@ -58,11 +58,14 @@ workflow.add_node("post_pr_comment", post_pr_comment)
 # 3. Add Edges
 workflow.add_edge(START, "read_pr_from_webhook")
 workflow.add_edge("read_pr_from_webhook", "fetch_pr_info")
+# policy_rule_analysis only needs pr_info, so it runs alongside the JIRA
+# branch instead of waiting for it; post_pr_comment joins both.
 workflow.add_edge("fetch_pr_info", "analyze_jira_ticket_number")
+workflow.add_edge("fetch_pr_info", "policy_rule_analysis")
 workflow.add_edge("analyze_jira_ticket_number", "jira_to_code_llm_analysis")
-workflow.add_edge("analyze_jira_ticket_number", "policy_rule_analysis")
-workflow.add_edge("jira_to_code_llm_analysis", "post_pr_comment")
-workflow.add_edge("policy_rule_analysis", "post_pr_comment")
+workflow.add_edge(
+    ["jira_to_code_llm_analysis", "policy_rule_analysis"], "post_pr_comment"
+)
 workflow.add_edge("post_pr_comment", END)
 
 # 4. Compile
@@ -1,14 +1,18 @@
 """Node for analyzing JIRA ticket description versus code changes using LLM in change management agent"""
 
+import hashlib
+import re
+from collections import OrderedDict
 from typing import Literal
 
 from sqlmodel import SQLModel, Field
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.llm import default_llm
 from app.services.change_management.state import AgentState
 from app.services.change_management.prompts import SEMANTIC_RISK_AUDIT_PROMPT
-from app.services.change_management.nodes.utils import make_result
+from app.services.change_management.nodes.utils import make_result, truncate_diff
 
 logger = get_logger(__name__)
 
@@ -28,6 +32,69 @@ class JIRAAnalysisOutput(SQLModel):
     )
 
 
+# Runnables are immutable once composed, so the structured-output chain
+# (and its derived tool schema) is built once and shared across calls.
+_AUDIT_CHAIN = SEMANTIC_RISK_AUDIT_PROMPT | default_llm.with_structured_output(
+    JIRAAnalysisOutput
+)
+
+# Completed audits, keyed by content hash, so replays and re-runs of an
+# unchanged diff skip the LLM round trip. Bounded LRU, per process.
+_AUDIT_CACHE_MAX = 256
+_audit_cache: "OrderedDict[str, JIRAAnalysisOutput]" = OrderedDict()
+
+# Model and prompt are part of the key so changing either invalidates entries.
+_AUDIT_KEY_PREFIX = (
+    f"{default_llm.model_name}|"
+    f"{hashlib.sha256(SEMANTIC_RISK_AUDIT_PROMPT.template.encode()).hexdigest()}|"
+)
+
+
+def _audit_cache_key(jira_description: str, diff: str) -> str:
+    h = hashlib.sha256(_AUDIT_KEY_PREFIX.encode())
+    h.update(jira_description.encode())
+    h.update(b"\0")
+    h.update(diff.encode())
+    return h.hexdigest()
+
+
+async def _run_audit(jira_description: str, diff: str) -> JIRAAnalysisOutput:
+    """Invoke the audit chain, reusing a cached result for identical input."""
+    key = _audit_cache_key(jira_description, diff)
+    cached = _audit_cache.get(key)
+    if cached is not None:
+        _audit_cache.move_to_end(key)
+        logger.info("LLM analysis cache hit")
+        return cached
+
+    result = await _AUDIT_CHAIN.ainvoke(
+        {
+            "jira_ticket_description": jira_description,
+            "diff": diff,
+        }
+    )
+    if isinstance(result, dict):
+        result = JIRAAnalysisOutput(**result)
+
+    _audit_cache[key] = result
+    if len(_audit_cache) > _AUDIT_CACHE_MAX:
+        _audit_cache.popitem(last=False)
+    return result
+
+
+# Docs, stylesheets and test code under a tests/ directory. Deliberately
+# narrow: .txt (requirements, CMakeLists) and test fixtures (SQL, data)
+# can change behaviour and must still be audited.
+_TRIVIAL_PATH_RE = re.compile(r"\.(css|md|rst)$|(^|/)tests?/.*\.(py|js|ts)$")
+
+
+def _is_trivial_change(changed_files: list[dict]) -> bool:
+    """Return whether every changed file is docs, tests or stylesheets."""
+    return bool(changed_files) and all(
+        _TRIVIAL_PATH_RE.search(f.get("path", "")) for f in changed_files
+    )
+
+
 def _extract_jira_description(metadata: dict) -> str:
     """Extract human-readable description from JIRA issue metadata.
 
@@ -99,19 +166,34 @@ async def jira_to_code_llm_analysis(state: AgentState) -> dict:
             details={"jira_ticket_number": state.jira_ticket_number},
         )
 
-    # Build the LLM chain with structured output
-    llm = default_llm.with_structured_output(JIRAAnalysisOutput)
-    chain = SEMANTIC_RISK_AUDIT_PROMPT | llm
+    changed_files = pr_info.get("changed_files", [])
+    if settings.LLM_SKIP_TRIVIAL_CHANGES and _is_trivial_change(changed_files):
+        logger.info("Only docs/tests/styles changed, skipping LLM analysis.")
+        return make_result(
+            node_name=_NODE_NAME,
+            reason_code="JIRA_TO_CODE_LLM_ANALYSIS_SKIPPED_TRIVIAL_CHANGE",
+            summary=(
+                "[UNKNOWN RISK] LLM analysis skipped — only documentation, "
+                "tests or styles changed."
+            ),
+            risk_level="UNKNOWN",
+            details={
+                "jira_ticket_number": state.jira_ticket_number,
+                "changed_files": [f.get("path", "") for f in changed_files],
+            },
+        )
+
+    prompt_diff = truncate_diff(diff, settings.LLM_DIFF_MAX_CHARS)
+    diff_truncated = prompt_diff != diff
+    if diff_truncated:
+        logger.info(
+            "Truncated diff for LLM analysis: %d -> %d chars",
+            len(diff),
+            len(prompt_diff),
+        )
 
     try:
-        result = await chain.ainvoke(
-            {
-                "jira_ticket_description": jira_description,
-                "diff": diff,
-            }
-        )
-        if isinstance(result, dict):
-            result = JIRAAnalysisOutput(**result)
+        result = await _run_audit(jira_description, prompt_diff)
     except Exception as e:
         logger.error("LLM analysis failed: %s", e, exc_info=True)
         return make_result(
@@ -124,6 +206,10 @@ async def jira_to_code_llm_analysis(state: AgentState) -> dict:
 
     risk = result.risk_level
     reason = result.reason
+    if diff_truncated:
+        # The auditor never saw the omitted code, so it cannot vouch for it.
+        risk = "UNKNOWN"
+        reason = f"{reason} (Diff was truncated; omitted changes were not reviewed.)"
 
     logger.info(
         "LLM analysis for %s: risk=%s reason=%s",
@@ -141,5 +227,6 @@ async def jira_to_code_llm_analysis(state: AgentState) -> dict:
             "jira_ticket_number": state.jira_ticket_number,
             "risk_level": risk,
             "reason": reason,
+            "diff_truncated": diff_truncated,
         },
     )
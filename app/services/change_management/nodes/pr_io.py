@@ -92,7 +92,8 @@ async def fetch_pr_info(
             raise
 
     try:
-        pr_info = await GitHubClient(client, token).fetch_pr_info(
+        github_client = GitHubClient(client, token, state.installation_id)
+        pr_info = await github_client.fetch_pr_info(
             state.owner, state.repo, state.pr_number, include_diff=True
         )
     except httpx.HTTPError as exc:
@@ -127,7 +128,7 @@ async def post_pr_comment(
         try:
             token = await get_access_token(client, state.installation_id)
 
-            github_client = GitHubClient(client, token)
+            github_client = GitHubClient(client, token, state.installation_id)
             await github_client.post_pr_comment(
                 state.owner,
                 state.repo,
@@ -1,5 +1,7 @@
 """Shared utilities for change management analysis nodes."""
 
+import re
+
 from app.db.models.analysis_result import AnalysisResultCreate
 
 
@@ -29,3 +31,90 @@ def make_result(
         ],
         **extra,
     }
+
+
+_FILE_SPLIT_RE = re.compile(r"^(?=diff --git )", re.MULTILINE)
+_FILE_PATH_RE = re.compile(r"^diff --git a/(.+?) b/")
+_MARKER_RESERVE = 64  # room for a per-file "[TRUNCATED ...]" marker
+
+
+def _split_file_header(section: str) -> tuple[str, str]:
+    """Split a file section into its header (up to the first hunk) and body."""
+    hunk = section.find("\n@@")
+    if hunk == -1:
+        hunk = section.find("\n")
+    if hunk == -1:
+        return section, ""
+    return section[: hunk + 1], section[hunk + 1 :]
+
+
+def _trim_body(body: str, budget: int) -> tuple[str, str, int]:
+    """Keep whole lines from both ends of *body* within *budget* characters.
+
+    Returns the kept head, the kept tail and the number of lines cut between.
+    """
+    lines = body.splitlines(keepends=True)
+    head, used = 0, 0
+    while head < len(lines) and used + len(lines[head]) <= budget // 2:
+        used += len(lines[head])
+        head += 1
+    tail = 0
+    while tail < len(lines) - head and used + len(lines[-1 - tail]) <= budget:
+        used += len(lines[-1 - tail])
+        tail += 1
+    return (
+        "".join(lines[:head]),
+        "".join(lines[len(lines) - tail :]),
+        len(lines) - head - tail,
+    )
+
+
+def truncate_diff(diff: str, max_chars: int) -> str:
+    """Shrink a unified diff to roughly ``max_chars`` for an LLM prompt.
+
+    Diffs within budget are returned unchanged. Otherwise the budget is
+    shared between files (small files first, so they stay whole) and each
+    oversized file keeps the first and last lines that fit, with a marker
+    for the cut. Every file header is always kept, and files whose content
+    was dropped entirely are listed at the end, so the result can exceed
+    ``max_chars`` for diffs touching very many files.
+    """
+    if len(diff) <= max_chars:
+        return diff
+
+    sections = [s for s in _FILE_SPLIT_RE.split(diff) if s]
+
+    budgets: dict[int, int] = {}
+    remaining, count = max_chars, len(sections)
+    for i in sorted(range(len(sections)), key=lambda i: len(sections[i])):
+        budgets[i] = min(len(sections[i]), remaining // count)
+        remaining -= budgets[i]
+        count -= 1
+
+    trimmed: list[str] = []
+    omitted: list[str] = []
+    for i, section in enumerate(sections):
+        if len(section) <= budgets[i]:
+            trimmed.append(section)
+            continue
+
+        header, body = _split_file_header(section)
+        head, tail, cut = _trim_body(
+            body, budgets[i] - len(header) - _MARKER_RESERVE
+        )
+        kept = (head + tail).splitlines()
+        if any(not line.startswith("@@") for line in kept):
+            trimmed.append(f"{header}{head}... [TRUNCATED {cut} lines] ...\n{tail}")
+        else:
+            # Only hunk markers (if anything) fit: drop them, keep the header.
+            lines = body.count("\n") + (not body.endswith("\n"))
+            trimmed.append(f"{header}... [TRUNCATED: all {lines} lines omitted] ...\n")
+            match = _FILE_PATH_RE.match(header)
+            omitted.append(match.group(1) if match else header.split("\n", 1)[0])
+
+    if omitted:
+        trimmed.append(
+            f"... [TRUNCATED: content omitted for {len(omitted)} files: "
+            f"{', '.join(omitted)}] ...\n"
+        )
+    return "".join(trimmed)
@@ -2,31 +2,70 @@
 Lightweight in-process notification for cache invalidation.
 
 Replaces the Valkey Streams → broadcast multiplexer → RingQueue pipeline
-with a single asyncio.Event.  The event naturally coalesces rapid signals
-(multiple `.set()` calls before a single `.wait()` returns are free).
+with a single asyncio.Event plus a generation counter.  Rapid signals
+coalesce naturally (multiple notifications before a single wait returns
+are consumed together), and the counter means a signal that races with
+a timeout or a clear is still reported on the next wait.
 """
 
 import asyncio
+from typing import Optional
 
-_update_event = asyncio.Event()
+# Created on first use rather than at import, like the evaluation cache,
+# so importing this module (CLI tools, Alembic) builds no asyncio
+# primitives.  Once awaited it is bound to that loop for good.
+_update_event: Optional[asyncio.Event] = None
+
+# The event only wakes the waiter; whether anything is pending is decided
+# by comparing generations, so a signal can never be lost to a clear().
+_generation = 0  # bumped by every notify_cache_update()
+_consumed_generation = 0  # last generation handed to the cache updater
+
+
+def _get_event() -> asyncio.Event:
+    global _update_event
+    if _update_event is None:
+        _update_event = asyncio.Event()
+    return _update_event
 
 
 def notify_cache_update() -> None:
     """Signal that evaluation data has changed (fire-and-forget, sync-safe)."""
-    _update_event.set()
+    global _generation
+    _generation += 1
+    _get_event().set()
+
+
+def _consume() -> bool:
+    """Mark every notification so far as handled; True if any were new."""
+    global _consumed_generation
+    _get_event().clear()
+    pending = _generation != _consumed_generation
+    _consumed_generation = _generation
+    return pending
+
+
+def drain_notifications() -> bool:
+    """
+    Consume any pending notification without waiting.
+
+    Returns True if one was pending.  Used to fold signals that arrive
+    while a refresh is being scheduled into that same refresh.
+    """
+    return _consume()
 
 
 async def wait_for_notification(timeout: float = 30.0) -> bool:
     """
     Wait until notified or *timeout* seconds elapse.
 
-    Returns True if a notification arrived, False on timeout.
-    Clears the event so the next call blocks again.
+    Returns True if a notification arrived (including one that landed
+    just as the wait timed out), False otherwise.  Consumes pending
+    notifications so the next call blocks again.
     """
-    try:
-        await asyncio.wait_for(_update_event.wait(), timeout=timeout)
-        _update_event.clear()
-        return True
-    except asyncio.TimeoutError:
-        _update_event.clear()
-        return False
+    if _generation == _consumed_generation:
+        try:
+            await asyncio.wait_for(_get_event().wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    return _consume()
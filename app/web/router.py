@@ -6,11 +6,11 @@ This keeps the API layer clean for pure JSON endpoints.
 """
 
 from typing import Annotated
-import asyncio
 
 from fastapi import APIRouter, Depends, Request, Query
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from sse_starlette.event import ServerSentEvent
 from sse_starlette.sse import EventSourceResponse
 
 from app.dependencies.services import get_evaluation_service
@@ -23,6 +23,14 @@ templates = Jinja2Templates(directory="app/templates")
 
 EvaluationServiceDep = Annotated[EvaluationService, Depends(get_evaluation_service)]
 
+# How long a new SSE client waits for the cache updater's first render
+# before giving up with an error event.
+_INITIAL_CACHE_TIMEOUT = 5.0  # seconds
+
+# Idle SSE connections get a comment ping at this interval from
+# sse-starlette's own ping task, keeping proxies from closing them.
+_KEEPALIVE_INTERVAL = 15  # seconds
+
 
 # -----------------------------------------------------------------------------
 # Page Routes
@@ -31,7 +39,7 @@ EvaluationServiceDep = Annotated[EvaluationService, Depends(get_evaluation_servi
 
 @router.get("/", response_class=HTMLResponse)
 async def root(request: Request, service: EvaluationServiceDep):
-    evals = await service.get_latest_per_pr(limit=5)
+    evals = await service.get_latest_per_pr(limit=5, include_results=False)
 
     # If HTMX request, return the dashboard partial
     if request.headers.get("HX-Request"):
@@ -87,6 +95,9 @@ async def sse_stream(request: Request):
     SSE clients wait on an asyncio.Condition inside the cache,
     so they are only woken *after* the cache updater has written
     fresh data (no race with the notifier signal).
+    Each update is yielded as the pre-encoded frame stored in the cache,
+    so fan-out costs no per-client serialization.
+    Keep-alive comments are sent by EventSourceResponse's ping task.
     """
 
     async def event_generator():
@@ -95,32 +106,35 @@ async def sse_stream(request: Request):
 
         # Send initial data from cache
         cached = await cache.get()
+        if not cached:
+            # Cache not initialized yet, wait for the first update to land
+            await cache.wait_for_update(0, timeout=_INITIAL_CACHE_TIMEOUT)
+            cached = await cache.get()
+
         if cached:
-            yield {"event": "eval-update", "data": cached.html}
+            yield cached.frame
             last_version = cached.version
         else:
-            # Cache not initialized yet, wait a bit
-            await asyncio.sleep(0.5)
-            cached = await cache.get()
-            if cached:
-                yield {"event": "eval-update", "data": cached.html}
-                last_version = cached.version
-            else:
-                yield {"event": "error", "data": "Cache not ready"}
+            yield {"event": "error", "data": "Cache not ready"}
 
         # Wait for cache updates (condition is signalled by cache_updater)
         while True:
             if await request.is_disconnected():
                 break
 
-            updated = await cache.wait_for_update(last_version, timeout=15.0)
+            # The timeout only bounds how long we go without re-checking
+            # the connection; keep-alives are handled by the ping task.
+            updated = await cache.wait_for_update(
+                last_version, timeout=_KEEPALIVE_INTERVAL
+            )
             if updated:
                 cached = await cache.get()
                 if cached:
-                    yield {"event": "eval-update", "data": cached.html}
+                    yield cached.frame
                     last_version = cached.version
-            else:
-                # Timeout — send keep-alive
-                yield {"comment": "keep-alive"}
 
-    return EventSourceResponse(event_generator())
+    return EventSourceResponse(
+        event_generator(),
+        ping=_KEEPALIVE_INTERVAL,
+        ping_message_factory=lambda: ServerSentEvent(comment="keep-alive"),
+    )
@@ -3,7 +3,11 @@
 import asyncio
 import pytest
 
-from app.services.change_management.cache import EvaluationCache
+from app.services.change_management import cache as cache_module
+from app.services.change_management.cache import (
+    EvaluationCache,
+    get_evaluation_cache,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -31,6 +35,15 @@ async def test_cache_update_stores_data():
     assert await cache.is_empty() is False
 
 
+@pytest.mark.asyncio
+async def test_cache_update_pre_encodes_sse_frame():
+    cache = EvaluationCache()
+    await cache.update("<p>hello</p>")
+
+    data = await cache.get()
+    assert data.frame == b"event: eval-update\r\ndata: <p>hello</p>\r\n\r\n"
+
+
 @pytest.mark.asyncio
 async def test_cache_version_increments_on_each_update():
     cache = EvaluationCache()
@@ -44,6 +57,17 @@ async def test_cache_version_increments_on_each_update():
     assert data.version == 3
 
 
+@pytest.mark.asyncio
+async def test_cache_update_skips_identical_html():
+    cache = EvaluationCache()
+    assert await cache.update("same") is True
+    assert await cache.update("same") is False
+
+    assert cache.get_version() == 1
+    got_update = await cache.wait_for_update(current_version=1, timeout=0.05)
+    assert got_update is False
+
+
 # ---------------------------------------------------------------------------
 # wait_for_update
 # ---------------------------------------------------------------------------
@@ -107,3 +131,12 @@ async def test_multiple_waiters_all_notified():
 
     assert all(results), "All waiters should have received the update"
     assert len(results) == 5
+
+
+def test_get_evaluation_cache_creates_singleton_on_first_use(monkeypatch):
+    monkeypatch.setattr(cache_module, "_cache", None)
+
+    first = get_evaluation_cache()
+
+    assert isinstance(first, EvaluationCache)
+    assert get_evaluation_cache() is first
@@ -0,0 +1,77 @@
+"""Tests for app.services.change_management.cache_updater."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.change_management import cache_updater
+from app.services.change_management.cache import EvaluationCache
+
+# The updater's asyncio.sleep is patched below; the tests themselves yield
+# to the loop with the real one.
+_real_sleep = asyncio.sleep
+
+
+async def _never_notified(timeout: float) -> bool:
+    await asyncio.Event().wait()
+    return False
+
+
+async def _run_until(cache: EvaluationCache, fetch: AsyncMock, sleep: AsyncMock):
+    """Run the updater without notifications until the cache is populated."""
+    with (
+        patch.object(cache_updater, "get_evaluation_cache", return_value=cache),
+        patch.object(cache_updater, "_fetch_and_render", fetch),
+        patch.object(cache_updater, "wait_for_notification", _never_notified),
+        patch.object(cache_updater.asyncio, "sleep", sleep),
+    ):
+        task = asyncio.create_task(cache_updater.cache_updater_task())
+        try:
+            async with asyncio.timeout(1.0):
+                while await cache.is_empty():
+                    await _real_sleep(0)
+        finally:
+            task.cancel()
+            await task
+
+
+def _fake_sleep() -> AsyncMock:
+    """Stand-in for asyncio.sleep that records delays but only yields."""
+
+    async def fake(delay, *args, **kwargs):
+        await _real_sleep(0)
+
+    return AsyncMock(side_effect=fake)
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_retried_with_growing_backoff():
+    cache = EvaluationCache()
+    fetch = AsyncMock(
+        side_effect=[RuntimeError("db down"), RuntimeError("db down"), "<p>ok</p>"]
+    )
+    sleep = _fake_sleep()
+
+    with patch.object(cache_updater.random, "random", return_value=0.5):
+        await _run_until(cache, fetch, sleep)
+
+    assert (await cache.get()).html == "<p>ok</p>"
+    assert fetch.await_count == 3
+    delays = [call.args[0] for call in sleep.await_args_list]
+    assert delays == [
+        cache_updater._ERROR_BACKOFF_INITIAL,
+        cache_updater._ERROR_BACKOFF_INITIAL * 2,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_successful_start_does_not_retry():
+    cache = EvaluationCache()
+    fetch = AsyncMock(return_value="<p>ok</p>")
+    sleep = _fake_sleep()
+
+    await _run_until(cache, fetch, sleep)
+
+    fetch.assert_awaited_once()
+    sleep.assert_not_awaited()
@@ -4,6 +4,9 @@ import hashlib
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from sqlalchemy.dialects import postgresql
+
+from app.services.change_management import evaluations
 from app.services.change_management.evaluations import EvaluationService
 
 
@@ -125,6 +128,101 @@ async def test_count_evaluations_returns_zero_on_none():
     assert count == 0
 
 
+@pytest.mark.asyncio
+async def test_get_latest_per_pr_binds_pagination_params():
+    session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=mock_result)
+
+    svc = EvaluationService(session)
+    await svc.get_latest_per_pr(skip=10, limit=5)
+
+    _stmt, params = session.execute.await_args.args
+    assert params == {"skip": 10, "limit": 5}
+
+
+@pytest.mark.asyncio
+async def test_get_latest_per_pr_summary_skips_analysis_results():
+    session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=mock_result)
+
+    svc = EvaluationService(session)
+    await svc.get_latest_per_pr(limit=5, include_results=False)
+
+    stmt, params = session.execute.await_args.args
+    assert params == {"skip": 0, "limit": 5}
+    assert stmt is evaluations._LATEST_PER_PR_SUMMARY_STMT
+
+
+@pytest.mark.asyncio
+async def test_get_evaluations_summary_skips_analysis_results():
+    session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=mock_result)
+
+    svc = EvaluationService(session)
+    await svc.get_evaluations(skip=5, limit=5, include_results=False)
+
+    stmt, params = session.execute.await_args.args
+    assert params == {"skip": 5, "limit": 5}
+    assert stmt is evaluations._EVALUATIONS_SUMMARY_STMT
+
+
+_RUN_CONTEXT = {
+    "evaluation_key": "o/r#1@sha:hash",
+    "owner": "o",
+    "repo": "r",
+    "pr_number": 1,
+}
+
+
+async def _create_run(returned_row: tuple) -> tuple[str, AsyncMock]:
+    session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.one.return_value = returned_row
+    session.execute = AsyncMock(return_value=mock_result)
+
+    svc = EvaluationService(session)
+    with patch.object(evaluations, "notify_cache_update"):
+        run_id = await svc._create_evaluation_run(dict(_RUN_CONTEXT))
+    return run_id, session
+
+
+def _compiled_sql(session: AsyncMock) -> str:
+    (stmt,) = session.execute.await_args.args
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+@pytest.mark.asyncio
+async def test_create_evaluation_run_upserts_in_one_round_trip(caplog):
+    with caplog.at_level("INFO", logger=evaluations.logger.name):
+        run_id, session = await _create_run(("new-uuid", True))
+
+    assert run_id == "new-uuid"
+    session.execute.assert_awaited_once()
+    session.commit.assert_awaited_once()
+    sql = _compiled_sql(session)
+    assert "ON CONFLICT (evaluation_key) DO UPDATE" in sql
+    assert "SET evaluation_key = excluded.evaluation_key" in sql
+    assert "RETURNING evaluation_run.id, xmax = 0 AS inserted" in sql
+    assert "Created evaluation run: new-uuid" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_create_evaluation_run_returns_existing_id_on_conflict(caplog):
+    with caplog.at_level("INFO", logger=evaluations.logger.name):
+        run_id, session = await _create_run(("existing-uuid", False))
+
+    assert run_id == "existing-uuid"
+    session.execute.assert_awaited_once()
+    assert "ON CONFLICT (evaluation_key) DO UPDATE" in _compiled_sql(session)
+    assert "Evaluation run already exists" in caplog.text
+
+
 # ---------------------------------------------------------------------------
 # run_evaluation_workflow — error path
 # ---------------------------------------------------------------------------
@@ -1,12 +1,37 @@
 """Tests for app.integrations.github.auth.get_access_token."""
 
+import asyncio
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from unittest.mock import patch
 
 import httpx
 
+from app.integrations.github import auth
 from tests.conftest import make_httpx_response
 
+_real_load_private_key = auth._load_private_key
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache(monkeypatch):
+    """Tokens and the App JWT are cached at module level; isolate each test."""
+    auth._token_cache.clear()
+    auth._token_locks.clear()
+    monkeypatch.setattr(auth, "_jwt_cache", None)
+    # The test settings hold a fake key; jwt.encode is patched in every test
+    monkeypatch.setattr(auth, "_load_private_key", lambda: "FAKE_PRIVATE_KEY")
+    yield
+    auth._token_cache.clear()
+    auth._token_locks.clear()
+
+
+def _expires_in(seconds: int) -> str:
+    """GitHub-style ``expires_at`` timestamp *seconds* from now."""
+    when = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return when.strftime("%Y-%m-%dT%H:%M:%SZ")
+
 
 # ---------------------------------------------------------------------------
 # get_access_token
@@ -70,3 +95,160 @@ async def test_get_access_token_builds_correct_jwt_payload(mock_http_client):
     assert "exp" in captured_payload
     assert "iss" in captured_payload
     assert captured_payload["exp"] > captured_payload["iat"]
+
+
+# ---------------------------------------------------------------------------
+# Installation token cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_get_access_token_reuses_cached_token(mock_http_client):
+    mock_http_client.post.return_value = make_httpx_response(
+        201, json_data={"token": "ghs_cached", "expires_at": _expires_in(3600)}
+    )
+
+    with patch(
+        "app.integrations.github.auth.jwt.encode", return_value="fake.jwt.token"
+    ):
+        first = await auth.get_access_token(mock_http_client, installation_id=7)
+        second = await auth.get_access_token(mock_http_client, installation_id=7)
+
+    assert first == second == "ghs_cached"
+    mock_http_client.post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_access_token_refreshes_near_expiry(mock_http_client):
+    """Tokens inside the refresh margin are fetched again."""
+    mock_http_client.post.side_effect = [
+        make_httpx_response(
+            201, json_data={"token": "ghs_old", "expires_at": _expires_in(60)}
+        ),
+        make_httpx_response(
+            201, json_data={"token": "ghs_new", "expires_at": _expires_in(3600)}
+        ),
+    ]
+
+    with patch(
+        "app.integrations.github.auth.jwt.encode", return_value="fake.jwt.token"
+    ):
+        first = await auth.get_access_token(mock_http_client, installation_id=7)
+        second = await auth.get_access_token(mock_http_client, installation_id=7)
+
+    assert (first, second) == ("ghs_old", "ghs_new")
+    assert mock_http_client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_access_token_cache_is_per_installation(mock_http_client):
+    mock_http_client.post.side_effect = [
+        make_httpx_response(
+            201, json_data={"token": "ghs_a", "expires_at": _expires_in(3600)}
+        ),
+        make_httpx_response(
+            201, json_data={"token": "ghs_b", "expires_at": _expires_in(3600)}
+        ),
+    ]
+
+    with patch(
+        "app.integrations.github.auth.jwt.encode", return_value="fake.jwt.token"
+    ):
+        token_a = await auth.get_access_token(mock_http_client, installation_id=1)
+        token_b = await auth.get_access_token(mock_http_client, installation_id=2)
+
+    assert (token_a, token_b) == ("ghs_a", "ghs_b")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_access_token_forces_refetch(mock_http_client):
+    mock_http_client.post.side_effect = [
+        make_httpx_response(
+            201, json_data={"token": "ghs_revoked", "expires_at": _expires_in(3600)}
+        ),
+        make_httpx_response(
+            201, json_data={"token": "ghs_new", "expires_at": _expires_in(3600)}
+        ),
+    ]
+
+    with patch(
+        "app.integrations.github.auth.jwt.encode", return_value="fake.jwt.token"
+    ):
+        first = await auth.get_access_token(mock_http_client, installation_id=7)
+        auth.invalidate_access_token(7, first)
+        second = await auth.get_access_token(mock_http_client, installation_id=7)
+
+    assert (first, second) == ("ghs_revoked", "ghs_new")
+
+
+def test_invalidate_access_token_keeps_newer_token():
+    auth._token_cache[7] = ("ghs_fresh", float("inf"))
+
+    auth.invalidate_access_token(7, "ghs_stale")
+
+    assert auth._cached_token(7) == "ghs_fresh"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_token_request(mock_http_client):
+    async def slow_post(*_args, **_kwargs):
+        await asyncio.sleep(0.02)
+        return make_httpx_response(
+            201, json_data={"token": "ghs_shared", "expires_at": _expires_in(3600)}
+        )
+
+    mock_http_client.post.side_effect = slow_post
+
+    with patch(
+        "app.integrations.github.auth.jwt.encode", return_value="fake.jwt.token"
+    ):
+        tokens = await asyncio.gather(
+            *(auth.get_access_token(mock_http_client, 7) for _ in range(5))
+        )
+
+    assert tokens == ["ghs_shared"] * 5
+    mock_http_client.post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_app_jwt_is_signed_once_across_installations(mock_http_client):
+    mock_http_client.post.side_effect = [
+        make_httpx_response(201, json_data={"token": "ghs_a"}),
+        make_httpx_response(201, json_data={"token": "ghs_b"}),
+    ]
+
+    with patch(
+        "app.integrations.github.auth.jwt.encode", return_value="fake.jwt.token"
+    ) as encode:
+        await auth.get_access_token(mock_http_client, installation_id=1)
+        await auth.get_access_token(mock_http_client, installation_id=2)
+
+    encode.assert_called_once()
+    for call in mock_http_client.post.call_args_list:
+        assert call[1]["headers"]["Authorization"] == "Bearer fake.jwt.token"
+
+
+def test_app_jwt_signed_with_parsed_private_key(monkeypatch):
+    """End to end: the PEM is parsed once and the JWT verifies against it."""
+    import jwt
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    monkeypatch.setattr(auth.settings, "GITHUB_APP_PRIVATE_KEY", pem)
+    monkeypatch.setattr(auth, "_load_private_key", _real_load_private_key)
+    _real_load_private_key.cache_clear()
+
+    try:
+        token = auth._get_app_jwt()
+        assert _real_load_private_key() is _real_load_private_key()
+    finally:
+        _real_load_private_key.cache_clear()
+
+    claims = jwt.decode(token, key.public_key(), algorithms=["RS256"])
+    assert claims["iss"] == auth.settings.GITHUB_APP_ID
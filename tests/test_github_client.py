@@ -1,6 +1,7 @@
 """Tests for app.integrations.github.client.GitHubClient."""
 
 import pytest
+from unittest.mock import AsyncMock, patch
 
 from tests.conftest import make_httpx_response
 from app.integrations.github.client import GitHubClient
@@ -173,3 +174,61 @@ async def test_post_pr_comment_success(mock_http_client):
     call_kwargs = mock_http_client.post.call_args[1]
     assert call_kwargs["json"] == {"body": "LGTM!"}
     assert "issues/3/comments" in mock_http_client.post.call_args[0][0]
+
+
+# ---------------------------------------------------------------------------
+# token refresh on 401
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_401_refreshes_installation_token_and_retries_once(mock_http_client):
+    mock_http_client.get.side_effect = [
+        make_httpx_response(401),
+        make_httpx_response(200, json_data={"number": 42}),
+    ]
+
+    client = GitHubClient(mock_http_client, token="revoked", installation_id=7)
+    with (
+        patch("app.integrations.github.client.invalidate_access_token") as invalidate,
+        patch(
+            "app.integrations.github.client.get_access_token",
+            AsyncMock(return_value="fresh"),
+        ),
+    ):
+        result = await client.get_pr("octocat", "repo", 42)
+
+    assert result == {"number": 42}
+    invalidate.assert_called_once_with(7, "revoked")
+    retry_headers = mock_http_client.get.call_args_list[1][1]["headers"]
+    assert retry_headers["Authorization"] == "token fresh"
+
+
+@pytest.mark.asyncio
+async def test_401_without_installation_id_is_not_retried(mock_http_client):
+    import httpx
+
+    mock_http_client.get.return_value = make_httpx_response(401)
+
+    client = GitHubClient(mock_http_client, token="ghp_personal")
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_pr("octocat", "repo", 42)
+
+    mock_http_client.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_persistent_401_is_raised_after_one_retry(mock_http_client):
+    import httpx
+
+    mock_http_client.post.return_value = make_httpx_response(401)
+
+    client = GitHubClient(mock_http_client, token="revoked", installation_id=7)
+    with patch(
+        "app.integrations.github.client.get_access_token",
+        AsyncMock(return_value="also-revoked"),
+    ):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.post_pr_comment("owner", "repo", 3, "LGTM!")
+
+    assert mock_http_client.post.call_count == 2
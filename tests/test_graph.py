@@ -0,0 +1,54 @@
+"""Tests for the wiring of app.services.change_management.graph."""
+
+import operator
+from typing import Annotated, TypedDict
+
+from langgraph.graph import StateGraph
+
+from app.services.change_management import graph
+
+
+def _edges() -> set[tuple[str, str]]:
+    return {
+        (edge.source, edge.target)
+        for edge in graph.change_management_graph.get_graph().edges
+    }
+
+
+def test_policy_analysis_starts_after_fetch_pr_info():
+    edges = _edges()
+
+    assert ("fetch_pr_info", "policy_rule_analysis") in edges
+    assert ("analyze_jira_ticket_number", "policy_rule_analysis") not in edges
+
+
+def test_post_pr_comment_joins_both_analysis_branches():
+    edges = _edges()
+
+    assert ("jira_to_code_llm_analysis", "post_pr_comment") in edges
+    assert ("policy_rule_analysis", "post_pr_comment") in edges
+    assert (
+        ("jira_to_code_llm_analysis", "policy_rule_analysis"),
+        "post_pr_comment",
+    ) in graph.workflow.waiting_edges
+
+
+class _TraceState(TypedDict):
+    trace: Annotated[list[str], operator.add]
+
+
+def test_post_pr_comment_runs_once_per_invocation():
+    """Replay the production wiring with stub nodes and count the visits."""
+    stub = StateGraph(_TraceState)
+    for name in graph.workflow.nodes:
+        stub.add_node(name, lambda _state, name=name: {"trace": [name]})
+    for start, end in graph.workflow.edges:
+        stub.add_edge(start, end)
+    for starts, end in graph.workflow.waiting_edges:
+        stub.add_edge(list(starts), end)
+
+    trace = stub.compile().invoke({"trace": []})["trace"]
+
+    assert trace.count("post_pr_comment") == 1
+    assert trace[-1] == "post_pr_comment"
+    assert set(trace) == set(graph.workflow.nodes)
@@ -0,0 +1,72 @@
+"""Tests for app.core.lifespan shutdown handling."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+
+from app.core import lifespan as lifespan_module
+
+
+class _FakeEngine:
+    def __init__(self, closed: list[str]):
+        self._closed = closed
+
+    async def dispose(self) -> None:
+        await asyncio.sleep(0.05)
+        self._closed.append("engine")
+
+
+async def _idle_cache_updater() -> None:
+    await asyncio.Event().wait()
+
+
+async def _start_shutdown(closed: list[str]) -> asyncio.Task:
+    """Enter the lifespan, slow its cleanup down and begin exiting it."""
+    app = FastAPI()
+    cm = lifespan_module.lifespan(app)
+    await cm.__aenter__()
+
+    async def slow_aclose() -> None:
+        await asyncio.sleep(0.05)
+        closed.append("http")
+
+    app.state.http_client.aclose = slow_aclose
+    exit_task = asyncio.ensure_future(cm.__aexit__(None, None, None))
+    await asyncio.sleep(0.01)  # let cleanup start
+    return exit_task
+
+
+@pytest.fixture
+def closed():
+    closed: list[str] = []
+    with (
+        patch.object(lifespan_module, "cache_updater_task", _idle_cache_updater),
+        patch.object(lifespan_module, "engine", _FakeEngine(closed)),
+    ):
+        yield closed
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_resources(closed):
+    exit_task = await _start_shutdown(closed)
+
+    await exit_task
+
+    assert sorted(closed) == ["engine", "http"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cancels", [1, 2])
+async def test_cancelled_shutdown_still_closes_resources(closed, cancels: int):
+    exit_task = await _start_shutdown(closed)
+
+    for _ in range(cancels):
+        exit_task.cancel()
+        await asyncio.sleep(0.005)
+
+    with pytest.raises(asyncio.CancelledError):
+        await exit_task
+
+    assert sorted(closed) == ["engine", "http"]
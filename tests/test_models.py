@@ -0,0 +1,79 @@
+"""Tests for the public DTO conversion on app.db.models."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.db.models.analysis_result import AnalysisResult
+from app.db.models.evaluation_run import EvaluationRun
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _make_run(**kwargs) -> EvaluationRun:
+    return EvaluationRun(
+        id=uuid.uuid4(),
+        evaluation_key="octocat/hello:7:deadbeef:abcd1234",
+        owner="octocat",
+        repo="hello",
+        pr_number=7,
+        start_ts=NOW,
+        **kwargs,
+    )
+
+
+def test_to_public_includes_loaded_results():
+    run = _make_run()
+    run.analysis_results = [
+        AnalysisResult(
+            id=uuid.uuid4(),
+            node_name="policy_rule_analysis",
+            reason_code="OK",
+            summary="fine",
+            updated_at=NOW,
+        )
+    ]
+
+    public = run.to_public()
+
+    assert [ar.node_name for ar in public.analysis_results] == [
+        "policy_rule_analysis"
+    ]
+    dumped = public.model_dump()
+    assert dumped["pr_number"] == 7
+    assert dumped["analysis_results"][0]["updated_at"] == NOW
+
+
+def test_to_public_without_results_skips_relationship():
+    run = _make_run()
+    run.analysis_results = [
+        AnalysisResult(
+            id=uuid.uuid4(),
+            node_name="policy_rule_analysis",
+            reason_code="OK",
+            summary="fine",
+            updated_at=NOW,
+        )
+    ]
+
+    public = run.to_public(include_results=False)
+
+    assert public.analysis_results == []
+    assert public.display_name == "octocat/hello #7"
+
+
+def test_to_public_with_unloaded_results_raises():
+    """An unloaded relationship fails loudly, never lazy-loads or reads as empty."""
+    run = _make_run()
+    run.__dict__.pop("analysis_results", None)
+
+    with pytest.raises(RuntimeError, match="analysis_results is not loaded"):
+        run.to_public()
+
+
+def test_to_public_with_unloaded_results_allowed_without_results():
+    run = _make_run()
+    run.__dict__.pop("analysis_results", None)
+
+    assert run.to_public(include_results=False).analysis_results == []
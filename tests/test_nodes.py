@@ -6,7 +6,7 @@ from langgraph.runtime import Runtime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.change_management.context import ChangeManagementContext
-from app.services.change_management.nodes.utils import make_result
+from app.services.change_management.nodes.utils import make_result, truncate_diff
 from app.services.change_management.nodes.analysis import (
     analyze_jira_ticket_number,
     is_retryable_jira_error,
@@ -16,6 +16,11 @@ from app.services.change_management.nodes.pr_io import (
     fetch_pr_info,
     is_retryable_github_error,
 )
+from app.services.change_management.nodes import llm_analysis
+from app.services.change_management.nodes.llm_analysis import (
+    JIRAAnalysisOutput,
+    jira_to_code_llm_analysis,
+)
 from app.services.change_management.state import AgentState
 from app.db.models.analysis_result import AnalysisResultCreate
 
@@ -62,6 +67,57 @@ def test_make_result_empty_details():
     assert result["analysis_results"][0].details == {}
 
 
+def _file_diff(name: str, n_lines: int, width: int = 0) -> str:
+    body = "".join(f"+line {i}{'x' * width}\n" for i in range(n_lines))
+    return (
+        f"diff --git a/{name} b/{name}\n--- a/{name}\n+++ b/{name}\n"
+        f"@@ -0,0 +1,{n_lines} @@\n{body}"
+    )
+
+
+def test_truncate_diff_leaves_small_diff_untouched():
+    diff = _file_diff("a.py", 10)
+    assert truncate_diff(diff, max_chars=40_000) is diff
+
+
+def test_truncate_diff_trims_large_file_keeping_head_and_tail():
+    diff = _file_diff("small.py", 5) + _file_diff("big.py", 5000)
+
+    result = truncate_diff(diff, max_chars=10_000)
+
+    assert len(result) <= 10_000
+    assert result.startswith(_file_diff("small.py", 5))
+    assert "diff --git a/big.py b/big.py" in result
+    assert "+line 0\n" in result
+    assert "+line 4999\n" in result
+    assert "[TRUNCATED" in result
+    assert "+line 2500\n" not in result
+
+
+def test_truncate_diff_keeps_small_file_next_to_wide_lines():
+    # Few but very long lines: trimming must be by size, not line count.
+    diff = _file_diff("big.py", 100, width=2000) + _file_diff("evil.py", 3)
+
+    result = truncate_diff(diff, max_chars=40_000)
+
+    assert _file_diff("evil.py", 3) in result
+    assert len(result) <= 40_000
+
+
+def test_truncate_diff_keeps_every_header_for_many_files():
+    diff = "".join(_file_diff(f"f{i}.py", 1, width=1000) for i in range(100))
+
+    result = truncate_diff(diff, max_chars=40_000)
+
+    for i in range(100):
+        assert f"diff --git a/f{i}.py b/f{i}.py\n" in result
+    assert "[TRUNCATED" in result
+    # Each file's share is too small for its one wide line, so every file is
+    # reduced to its header and listed as omitted.
+    assert "content omitted for 100 files: f0.py, f1.py," in result
+    assert len(result) < len(diff)
+
+
 # ===========================================================================
 # read_pr_from_webhook
 # ===========================================================================
@@ -285,3 +341,141 @@ def test_is_retryable_jira_error_http_status(status_code: int, expected: bool):
 
 def test_is_retryable_jira_error_request_error():
     assert is_retryable_jira_error(httpx.ConnectError("boom")) is True
+
+
+# ===========================================================================
+# jira_to_code_llm_analysis
+# ===========================================================================
+
+
+def _make_llm_state(diff: str = "diff --git a/x b/x") -> AgentState:
+    return AgentState(
+        jira_ticket_number="ABC-1",
+        jira_ticket_metadata={"fields": {"description": "Fix the thing"}},
+        pr_info={"diff": diff},
+    )
+
+
+@pytest.fixture
+def mock_audit_chain():
+    chain = MagicMock()
+    chain.ainvoke = AsyncMock(
+        return_value=JIRAAnalysisOutput(risk_level="LOW", reason="matches")
+    )
+    with (
+        patch.object(llm_analysis, "_AUDIT_CHAIN", chain),
+        patch.object(llm_analysis, "_audit_cache", llm_analysis.OrderedDict()),
+    ):
+        yield chain
+
+
+@pytest.mark.asyncio
+async def test_llm_analysis_reuses_cached_result_for_same_input(mock_audit_chain):
+    first = await jira_to_code_llm_analysis(_make_llm_state())
+    second = await jira_to_code_llm_analysis(_make_llm_state())
+
+    assert mock_audit_chain.ainvoke.await_count == 1
+    assert first["risk_level"] == second["risk_level"] == "LOW"
+
+
+@pytest.mark.asyncio
+async def test_llm_analysis_cache_misses_on_different_diff(mock_audit_chain):
+    await jira_to_code_llm_analysis(_make_llm_state("diff --git a/x b/x"))
+    await jira_to_code_llm_analysis(_make_llm_state("diff --git a/y b/y"))
+
+    assert mock_audit_chain.ainvoke.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_llm_analysis_does_not_cache_failures(mock_audit_chain):
+    mock_audit_chain.ainvoke.side_effect = [
+        RuntimeError("boom"),
+        JIRAAnalysisOutput(risk_level="LOW", reason="ok"),
+    ]
+
+    failed = await jira_to_code_llm_analysis(_make_llm_state())
+    retried = await jira_to_code_llm_analysis(_make_llm_state())
+
+    assert failed["risk_level"] == "UNKNOWN"
+    assert retried["risk_level"] == "LOW"
+    assert mock_audit_chain.ainvoke.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_llm_analysis_skips_llm_for_trivial_changes(mock_audit_chain):
+    state = _make_llm_state()
+    state.pr_info["changed_files"] = [
+        {"path": "README.md"},
+        {"path": "tests/test_nodes.py"},
+        {"path": "app/static/site.css"},
+    ]
+
+    with patch.object(llm_analysis.settings, "LLM_SKIP_TRIVIAL_CHANGES", True):
+        result = await jira_to_code_llm_analysis(state)
+
+    mock_audit_chain.ainvoke.assert_not_awaited()
+    assert result["risk_level"] == "UNKNOWN"
+    assert (
+        result["analysis_results"][0].reason_code
+        == "JIRA_TO_CODE_LLM_ANALYSIS_SKIPPED_TRIVIAL_CHANGE"
+    )
+
+
+@pytest.mark.asyncio
+async def test_llm_analysis_trivial_skip_is_off_by_default(mock_audit_chain):
+    state = _make_llm_state()
+    state.pr_info["changed_files"] = [{"path": "README.md"}]
+
+    await jira_to_code_llm_analysis(state)
+
+    mock_audit_chain.ainvoke.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "app/services/change_management/graph.py",
+        "requirements.txt",
+        "CMakeLists.txt",
+        "src/tests/data/payload.sql",
+        "test_settings.py",
+    ],
+)
+def test_is_trivial_change_rejects_behavioural_files(path: str):
+    changed_files = [{"path": "README.md"}, {"path": path}]
+    assert llm_analysis._is_trivial_change(changed_files) is False
+
+
+@pytest.mark.parametrize(
+    "path", ["docs/guide.rst", "tests/test_nodes.py", "web/tests/app.test.ts"]
+)
+def test_is_trivial_change_accepts_docs_and_test_code(path: str):
+    assert llm_analysis._is_trivial_change([{"path": path}]) is True
+
+
+@pytest.mark.asyncio
+async def test_llm_analysis_truncated_diff_is_capped_at_unknown(mock_audit_chain):
+    state = _make_llm_state(_file_diff("big.py", 10_000))
+
+    with patch.object(llm_analysis.settings, "LLM_DIFF_MAX_CHARS", 40_000):
+        result = await jira_to_code_llm_analysis(state)
+
+    details = result["analysis_results"][0].details
+    assert details["diff_truncated"] is True
+    assert result["risk_level"] == "UNKNOWN"
+    assert "not reviewed" in details["reason"]
+
+
+@pytest.mark.asyncio
+async def test_llm_analysis_diff_within_budget_keeps_llm_verdict(mock_audit_chain):
+    diff = _file_diff("big.py", 10_000)  # ~110 KB
+    state = _make_llm_state(diff)
+
+    with patch.object(llm_analysis.settings, "LLM_DIFF_MAX_CHARS", len(diff)):
+        result = await jira_to_code_llm_analysis(state)
+
+    details = result["analysis_results"][0].details
+    assert details["diff_truncated"] is False
+    assert result["risk_level"] == "LOW"
+    sent = mock_audit_chain.ainvoke.await_args.args[0]["diff"]
+    assert sent == diff
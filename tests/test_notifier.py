@@ -0,0 +1,61 @@
+"""Tests for app.services.change_management.notifier."""
+
+import asyncio
+import pytest
+
+from app.services.change_management import notifier
+
+
+@pytest.fixture(autouse=True)
+def fresh_notifier(monkeypatch):
+    """Each test gets its own event (pytest-asyncio uses a loop per test)."""
+    monkeypatch.setattr(notifier, "_update_event", None)
+    monkeypatch.setattr(notifier, "_generation", 0)
+    monkeypatch.setattr(notifier, "_consumed_generation", 0)
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_true_after_notify():
+    notifier.notify_cache_update()
+    assert await notifier.wait_for_notification(timeout=0.05) is True
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_false_on_timeout():
+    assert await notifier.wait_for_notification(timeout=0.05) is False
+
+
+@pytest.mark.asyncio
+async def test_burst_of_notifications_is_consumed_once():
+    for _ in range(5):
+        notifier.notify_cache_update()
+
+    assert await notifier.wait_for_notification(timeout=0.05) is True
+    assert await notifier.wait_for_notification(timeout=0.05) is False
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_on_later_notify():
+    async def notify_later():
+        await asyncio.sleep(0.02)
+        notifier.notify_cache_update()
+
+    task = asyncio.create_task(notify_later())
+    assert await notifier.wait_for_notification(timeout=1.0) is True
+    await task
+
+
+@pytest.mark.asyncio
+async def test_notification_survives_event_clear():
+    notifier.notify_cache_update()
+    # Simulate the event being cleared before the waiter looks at it
+    notifier._get_event().clear()
+
+    assert await notifier.wait_for_notification(timeout=0.05) is True
+
+
+def test_drain_notifications_reports_pending():
+    assert notifier.drain_notifications() is False
+    notifier.notify_cache_update()
+    assert notifier.drain_notifications() is True
+    assert notifier.drain_notifications() is False